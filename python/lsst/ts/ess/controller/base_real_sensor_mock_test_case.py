@@ -95,11 +95,12 @@ class BaseRealSensorMockTestCase(unittest.IsolatedAsyncioTestCase):
         """
         assert length == 1
 
-        terminator = self.sensor.terminator
-        if self.add_null_character_in_terminator:
-            terminator = "\x00".join(self.sensor.terminator)
-
+        # Only compute the terminator and sensor output when a new line of
+        # output is needed; this method gets called once per character.
         if self._sensor_output is None:
+            terminator = self.sensor.terminator
+            if self.add_null_character_in_terminator:
+                terminator = "\x00".join(self.sensor.terminator)
             formatter = common.device.MockTemperatureFormatter()
             self._sensor_output = (
                 self.sensor.delimiter.join(
@@ -22,6 +22,7 @@
 __all__ = ["CommandHandler", "run_ess_controller"]
 
 import asyncio
+import contextlib
 import logging
 import typing
 
@@ -29,6 +30,18 @@ from lsst.ts.ess import common
 
 from .device import RpiSerialHat, VcpFtdi
 
+# Maximum number of telemetry replies held while waiting for the callback to
+# send them. When the queue is full, the oldest reply gets dropped.
+TELEMETRY_QUEUE_SIZE = 256
+
+# Map the supported device types to the device class and the configuration
+# key that holds the hardware device ID. Built once at import time so
+# create_device doesn't rebuild the dispatch for every device.
+_DEVICE_TYPES = {
+    common.DeviceType.FTDI: (VcpFtdi, common.Key.FTDI_ID),
+    common.DeviceType.SERIAL: (RpiSerialHat, common.Key.SERIAL_PORT),
+}
+
 
 class CommandHandler(common.AbstractCommandHandler):
     """Handle incoming commands and send replies. Apply configuration and read
@@ -64,6 +77,71 @@ class CommandHandler(common.AbstractCommandHandler):
 
     valid_simulation_modes = (0, 1)
 
+    def __init__(self, callback: typing.Callable, simulation_mode: int) -> None:
+        super().__init__(callback=callback, simulation_mode=simulation_mode)
+        # Queue decoupling the device read loops from the telemetry callback,
+        # so back-pressure from a slow client cannot stall reading sensor
+        # data. The queue gets drained by the telemetry writer task.
+        self._telemetry_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=TELEMETRY_QUEUE_SIZE
+        )
+        self._telemetry_writer_task: typing.Optional[asyncio.Task] = None
+
+    async def _enqueue_telemetry(self, reply: typing.Dict[str, typing.Any]) -> None:
+        """Queue a telemetry reply to be sent by the telemetry writer task.
+
+        If the queue is full then the oldest reply gets dropped, so the
+        device read loops never stall on a slow client.
+
+        Parameters
+        ----------
+        reply : `dict`
+            The telemetry reply to send.
+        """
+        if self._telemetry_writer_task is None or self._telemetry_writer_task.done():
+            self._telemetry_writer_task = asyncio.create_task(
+                self._write_telemetry(), name="write_telemetry"
+            )
+        if self._telemetry_queue.full():
+            oldest = self._telemetry_queue.get_nowait()
+            self.log.warning(f"Telemetry queue full. Dropping {oldest}.")
+        self._telemetry_queue.put_nowait(reply)
+
+    async def _write_telemetry(self) -> None:
+        """Send queued telemetry replies to the callback, one at a time.
+
+        If the callback raises, e.g. because the client has disconnected,
+        the error gets logged and the reply gets dropped, consistent with
+        the drop policy of the queue. The writer task keeps draining the
+        queue so the device read loops are not affected.
+        """
+        while True:
+            reply = await self._telemetry_queue.get()
+            try:
+                await self._callback(reply)
+            except Exception:
+                self.log.exception("Sending telemetry failed. Dropping the reply.")
+
+    async def stop_sending_telemetry(self) -> common.ResponseCode:
+        """Stop reading the sensor data and stop the telemetry writer task.
+
+        Returns
+        -------
+        response_code : `common.ResponseCode`
+            The response code returned by the parent class method.
+        """
+        response_code = await super().stop_sending_telemetry()
+        if self._telemetry_writer_task is not None:
+            self._telemetry_writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._telemetry_writer_task
+            self._telemetry_writer_task = None
+        # Discard any replies still queued, so telemetry read before the stop
+        # doesn't get sent after a later reconfiguration.
+        while not self._telemetry_queue.empty():
+            self._telemetry_queue.get_nowait()
+        return response_code
+
     def create_device(
         self, device_configuration: typing.Dict[str, typing.Any]
     ) -> common.device.BaseDevice:
@@ -94,53 +172,45 @@ class CommandHandler(common.AbstractCommandHandler):
         In all other cases, the architecture of the platform is
         irrelevant.
         """
+        # Bind the repeatedly used configuration values to locals once.
+        name = device_configuration[common.Key.NAME]
         sensor = common.sensor.create_sensor(
             device_configuration=device_configuration, log=self.log
         )
         if self.simulation_mode == 1:
             self.log.debug(
-                f"Creating MockDevice with name {device_configuration[common.Key.NAME]} and sensor {sensor}"
+                "Creating MockDevice with name %s and sensor %s", name, sensor
             )
             device: common.device.BaseDevice = common.device.MockDevice(
-                name=device_configuration[common.Key.NAME],
+                name=name,
                 device_id=device_configuration[common.Key.FTDI_ID],
                 sensor=sensor,
-                callback_func=self._callback,
+                callback_func=self._enqueue_telemetry,
                 log=self.log,
             )
             return device
-        elif device_configuration[common.Key.DEVICE_TYPE] == common.DeviceType.FTDI:
-            self.log.debug(
-                f"Creating VcpFtdi device with name {device_configuration[common.Key.NAME]} "
-                f"and sensor {sensor}"
-            )
-            device = VcpFtdi(
-                name=device_configuration[common.Key.NAME],
-                device_id=device_configuration[common.Key.FTDI_ID],
-                sensor=sensor,
-                baud_rate=device_configuration[common.Key.BAUD_RATE],
-                callback_func=self._callback,
-                log=self.log,
+        device_type = device_configuration[common.Key.DEVICE_TYPE]
+        if device_type not in _DEVICE_TYPES:
+            raise RuntimeError(
+                f"Could not get a {device_type!r} device."
+                "Please check the configuration."
             )
-            return device
-        elif device_configuration[common.Key.DEVICE_TYPE] == common.DeviceType.SERIAL:
-            self.log.debug(
-                f"Creating RpiSerialHat device with name {device_configuration[common.Key.NAME]} "
-                f"and sensor {sensor}"
-            )
-            device = RpiSerialHat(
-                name=device_configuration[common.Key.NAME],
-                device_id=device_configuration[common.Key.SERIAL_PORT],
-                sensor=sensor,
-                baud_rate=device_configuration[common.Key.BAUD_RATE],
-                callback_func=self._callback,
-                log=self.log,
-            )
-            return device
-        raise RuntimeError(
-            f"Could not get a {device_configuration[common.Key.DEVICE_TYPE]!r} device."
-            "Please check the configuration."
+        device_class, device_id_key = _DEVICE_TYPES[device_type]
+        self.log.debug(
+            "Creating %s device with name %s and sensor %s",
+            device_class.__name__,
+            name,
+            sensor,
+        )
+        device = device_class(
+            name=name,
+            device_id=device_configuration[device_id_key],
+            sensor=sensor,
+            baud_rate=device_configuration[common.Key.BAUD_RATE],
+            callback_func=self._enqueue_telemetry,
+            log=self.log,
         )
+        return device
 
 
 def run_ess_controller() -> None:
@@ -90,6 +90,11 @@ class RpiSerialHat(common.device.BaseDevice):
         self.enhanced_terminator_regex = re.compile(enhanced_terminator)
         self.terminator_regex = re.compile("^.*" + enhanced_terminator + "$")
 
+        # The enhanced terminator matches at most this many characters, so
+        # keeping this many characters at the end of a line suffices to
+        # detect the terminator.
+        self._terminator_tail_len = 2 * len(self.sensor.terminator) - 1
+
     async def basic_open(self) -> None:
         """Open and configure serial port.
         Open the serial communications port and set BAUD.
@@ -100,7 +105,10 @@ class RpiSerialHat(common.device.BaseDevice):
         """
         if not self.ser.is_open:
             try:
-                self.ser.open()
+                # Run the blocking call in an executor so the event loop, and
+                # with it the I/O of the other devices, doesn't get blocked.
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self.ser.open)
                 self.log.info(f"Serial port {self.device_id} opened.")
             except SerialException as e:
                 self.log.exception(f"Serial port {self.device_id} open failed.")
@@ -118,16 +126,47 @@ class RpiSerialHat(common.device.BaseDevice):
             one. May be returned empty if nothing was received or partial if
             the readline was started during device reception.
         """
-        line: str = ""
         # get running loop to run blocking tasks
         loop = asyncio.get_running_loop()
-        while not self.terminator_regex.match(line):
-            ch = await loop.run_in_executor(None, self.ser.read, 1)
-            line += ch.decode(encoding=self.sensor.charset)
-        line = self.enhanced_terminator_regex.sub(self.sensor.terminator, line)
-        self.log.debug(f"Returning {self.name} {line=}")
+        # Read the full line in a single executor call so each telemetry
+        # sample costs one thread round trip instead of one per character.
+        line = await loop.run_in_executor(None, self._read_until_terminator)
+        # Reading stops at the first terminator match, so normalizing a
+        # terminator that has an unexpected character, e.g. a NULL character,
+        # inside it only needs to look at the tail of the line.
+        tail_start = max(len(line) - self._terminator_tail_len, 0)
+        line = line[:tail_start] + self.enhanced_terminator_regex.sub(
+            self.sensor.terminator, line[tail_start:]
+        )
+        # Guard the debug call so no format arguments get built for every
+        # telemetry line when debug logging is off.
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Returning %s line=%r", self.name, line)
         return line
 
+    def _read_until_terminator(self) -> str:
+        """Read characters from the device until the terminator is seen.
+
+        This blocks and must be called from an executor thread.
+
+        Returns
+        -------
+        line : `str`
+            The characters read, including the terminator.
+        """
+        # Collect the characters in a list and join once, instead of
+        # reallocating a growing line string for every character. Only the
+        # tail of the line needs to be kept for the terminator check.
+        chars: list[str] = []
+        tail = ""
+        while not self.terminator_regex.match(tail):
+            ch = self.ser.read(1).decode(encoding=self.sensor.charset)
+            if not ch:
+                continue
+            chars.append(ch)
+            tail = (tail + ch)[-self._terminator_tail_len :]
+        return "".join(chars)
+
     async def basic_close(self) -> None:
         """Close the Sensor Device.
 
@@ -136,7 +175,8 @@ class RpiSerialHat(common.device.BaseDevice):
         IOError if virtual communications port fails to close.
         """
         if self.ser.is_open:
-            self.ser.close()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self.ser.close)
             self.log.info(f"Serial port {self.device_id} closed.")
         else:
             self.log.info(f"Serial port {self.device_id} already closed.")
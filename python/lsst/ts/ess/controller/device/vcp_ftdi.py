@@ -82,6 +82,11 @@ class VcpFtdi(common.device.BaseDevice):
         self.enhanced_terminator_regex = re.compile(enhanced_terminator)
         self.terminator_regex = re.compile("^.*" + enhanced_terminator + "$")
 
+        # The enhanced terminator matches at most this many characters, so
+        # keeping this many characters at the end of a line suffices to
+        # detect the terminator.
+        self._terminator_tail_len = 2 * len(self.sensor.terminator) - 1
+
     async def basic_open(self) -> None:
         """Open the Sensor Device.
 
@@ -92,17 +97,28 @@ class VcpFtdi(common.device.BaseDevice):
         ------
         IOError if virtual communications port fails to open.
         """
+        # Run the blocking calls in an executor so the event loop, and with it
+        # the I/O of the other devices, doesn't get blocked.
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._blocking_open)
+        if not self.vcp.closed:
+            self.log.debug("FTDI device open.")
+        else:
+            self.log.error("Failed to open the FTDI device.")
+            raise IOError(f"{self.name}: Failed to open the FTDI device.")
+
+    def _blocking_open(self) -> None:
+        """Open the device, set the baud rate and flush the buffers.
+
+        This blocks and must be called from an executor thread.
+        """
         self.vcp.open()
         # Setting the baud rate requires the vcp Device to have set up a
         # context, which only happens when open() is called. That's why this
         # next line *needs* to be called after calling open().
         self.vcp.baudrate = self.baud_rate
         if not self.vcp.closed:
-            self.log.debug("FTDI device open.")
             self.vcp.flush()
-        else:
-            self.log.error("Failed to open the FTDI device.")
-            raise IOError(f"{self.name}: Failed to open the FTDI device.")
 
     async def readline(self) -> str:
         """Read a line of telemetry from the device.
@@ -114,15 +130,47 @@ class VcpFtdi(common.device.BaseDevice):
             one. May be returned empty if nothing was received or partial if
             the readline was started during device reception.
         """
-        line: str = ""
         # get running loop to run blocking tasks
         loop = asyncio.get_running_loop()
-        while not self.terminator_regex.match(line):
-            line += await loop.run_in_executor(None, self.vcp.read, 1)
-        line = self.enhanced_terminator_regex.sub(self.sensor.terminator, line)
-        self.log.debug(f"Returning {self.name} {line=}")
+        # Read the full line in a single executor call so each telemetry
+        # sample costs one thread round trip instead of one per character.
+        line = await loop.run_in_executor(None, self._read_until_terminator)
+        # Reading stops at the first terminator match, so normalizing a
+        # terminator that has an unexpected character, e.g. a NULL character,
+        # inside it only needs to look at the tail of the line.
+        tail_start = max(len(line) - self._terminator_tail_len, 0)
+        line = line[:tail_start] + self.enhanced_terminator_regex.sub(
+            self.sensor.terminator, line[tail_start:]
+        )
+        # Guard the debug call so no format arguments get built for every
+        # telemetry line when debug logging is off.
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Returning %s line=%r", self.name, line)
         return line
 
+    def _read_until_terminator(self) -> str:
+        """Read characters from the device until the terminator is seen.
+
+        This blocks and must be called from an executor thread.
+
+        Returns
+        -------
+        line : `str`
+            The characters read, including the terminator.
+        """
+        # Collect the characters in a list and join once, instead of
+        # reallocating a growing line string for every character. Only the
+        # tail of the line needs to be kept for the terminator check.
+        chars: list[str] = []
+        tail = ""
+        while not self.terminator_regex.match(tail):
+            ch = self.vcp.read(1)
+            if not ch:
+                continue
+            chars.append(ch)
+            tail = (tail + ch)[-self._terminator_tail_len :]
+        return "".join(chars)
+
     async def basic_close(self) -> None:
         """Close the Sensor Device.
 
@@ -130,7 +178,8 @@ class VcpFtdi(common.device.BaseDevice):
         ------
         IOError if virtual communications port fails to close.
         """
-        self.vcp.close()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.vcp.close)
         if self.vcp.closed:
             self.log.debug("FTDI device closed.")
         else:
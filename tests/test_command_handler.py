@@ -197,6 +197,56 @@ class CommandHandlerTestCase(unittest.IsolatedAsyncioTestCase):
         await self.command_handler.stop_sending_telemetry()
         assert self.command_handler._started is False
 
+    async def test_telemetry_queue_drops_oldest_when_full(self) -> None:
+        """Test that the oldest reply gets dropped when the queue is full."""
+        queue_size = controller.command_handler.TELEMETRY_QUEUE_SIZE
+        num_dropped = 2
+        # _enqueue_telemetry never yields to the event loop, so the telemetry
+        # writer task cannot start draining until the sleep below and the
+        # queue overflows deterministically.
+        for i in range(queue_size + num_dropped):
+            await self.command_handler._enqueue_telemetry({common.Key.TELEMETRY: i})
+        while len(self.responses) < queue_size:
+            await asyncio.sleep(0.1)
+        assert len(self.responses) == queue_size
+        # The oldest replies got dropped and the rest arrived in order.
+        assert self.responses[0] == {common.Key.TELEMETRY: num_dropped}
+        assert self.responses[-1] == {
+            common.Key.TELEMETRY: queue_size + num_dropped - 1
+        }
+        assert self.command_handler._telemetry_writer_task is not None
+        self.command_handler._telemetry_writer_task.cancel()
+
+    async def test_telemetry_after_stop_and_reconfigure(self) -> None:
+        """Test that telemetry flows again after a stop and a reconfigure."""
+        await self.command_handler.handle_command(
+            command=common.Command.CONFIGURE, configuration=self.configuration
+        )
+        self.assert_response(common.ResponseCode.OK)
+        # Give some time to the mock sensor to produce data.
+        while len(self.responses) < 1:
+            await asyncio.sleep(0.5)
+
+        await self.command_handler.stop_sending_telemetry()
+        assert self.command_handler._started is False
+        assert self.command_handler._telemetry_writer_task is None
+        assert self.command_handler._telemetry_queue.empty()
+        self.responses.clear()
+
+        # Send the same configuration again and verify that telemetry starts
+        # flowing again.
+        await self.command_handler.handle_command(
+            command=common.Command.CONFIGURE, configuration=self.configuration
+        )
+        self.assert_response(common.ResponseCode.OK)
+        while len(self.responses) < 1:
+            await asyncio.sleep(0.5)
+        reply = self.responses.pop()
+        assert common.Key.TELEMETRY in reply
+
+        await self.command_handler.stop_sending_telemetry()
+        assert self.command_handler._started is False
+
     async def test_get_telemetry(self) -> None:
         """Test handling of telemetry."""
         mtt = MockTestTools()